@@ -5,6 +5,7 @@ import os
 import monty
 import shutil
 import glob
+from concurrent.futures import ThreadPoolExecutor
 
 from fireworks import explicit_serialize, FiretaskBase, FWAction
 
@@ -371,19 +372,56 @@ class CopyFiles(FiretaskBase):
         """
         Defines the copy operation. Override this to customize copying.
         """
+        copies = []
         for f in self.files_to_copy:
             prev_path_full = os.path.join(self.from_dir, f)
             if self.suffix:
                 dest_path = os.path.join(self.to_dir, f, self.suffix)
             else:
                 dest_path = os.path.join(self.to_dir, f)
+            copies.append((prev_path_full, dest_path))
+        self.run_copies(self._copy_file, copies)
+
+    def _copy_file(self, src, dest):
+        try:
+            self.fileclient.copy(src, dest)
+        except FileNotFoundError as exc:
+            if not self.continue_on_missing:
+                raise exc
+
+    def run_copies(self, copy_func, copies, max_workers=8):
+        """
+        Run copy_func(*args) for every args in copies. On a local filesystem the
+        copies are dispatched to a thread pool to overlap the I/O. They are run
+        one after the other, in order, if the FileClient is remote (it shares a
+        single SFTP channel) or if two copies write to the same destination, so
+        that the later one still wins.
+
+        If a concurrent copy fails, the copies that have not started yet are
+        cancelled, the ones already running are allowed to finish and the first
+        failure is re-raised.
+
+        Args:
+            copy_func (callable): function performing a single copy
+            copies (list): list of argument tuples, one per copy; the second
+                element of each tuple must be the destination path
+            max_workers (int): maximum number of concurrent local copies
+        """
+        unique_dests = len({args[1] for args in copies}) == len(copies)
+        if self.fileclient.ssh is not None or len(copies) < 2 or not unique_dests:
+            for args in copies:
+                copy_func(*args)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(copies))) as executor:
+            futures = [executor.submit(copy_func, *args) for args in copies]
             try:
-                self.fileclient.copy(prev_path_full, dest_path)
-            except FileNotFoundError as exc:
-                if continue_on_missing:
-                    continue
-                else:
-                    raise exc
+                for future in futures:
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
 
     def run_task(self, fw_spec):
         self.setup_copy(
@@ -394,6 +432,7 @@ class CopyFiles(FiretaskBase):
             exclude_files=self.get("exclude_files", []),
             suffix=self.get("suffix", None),
             fw_spec=fw_spec,
+            continue_on_missing=self.get("continue_on_missing", False),
         )
         self.copy_files()
 
@@ -5,6 +5,7 @@ from atomate.common.firetasks.glue_tasks import (
     PassCalcLocs,
     get_calc_loc,
     CopyFilesFromCalcLoc,
+    CopyFiles,
     CreateFolder,
     DeleteFiles,
     DeleteFilesPrevFolder,
@@ -324,5 +325,35 @@ class TestCopyFilesFromCalcLoc(AtomateTest):
         )
 
 
+class TestCopyFiles(unittest.TestCase):
+    def _setup_dirs(self):
+        os.makedirs("from_dir")
+        os.makedirs("to_dir")
+        for fname in ["file_a", "file_b"]:
+            with open(os.path.join("from_dir", fname), "w") as f:
+                f.write(fname)
+
+    def test_copyfiles_continue_on_missing(self):
+        with ScratchDir("."):
+            self._setup_dirs()
+            CopyFiles(
+                from_dir="from_dir",
+                to_dir="to_dir",
+                files_to_copy=["file_a", "missing", "file_b"],
+                continue_on_missing=True,
+            ).run_task({})
+            self.assertEqual(sorted(os.listdir("to_dir")), ["file_a", "file_b"])
+
+    def test_copyfiles_missing_raises(self):
+        with ScratchDir("."):
+            self._setup_dirs()
+            task = CopyFiles(
+                from_dir="from_dir",
+                to_dir="to_dir",
+                files_to_copy=["file_a", "missing", "file_b"],
+            )
+            self.assertRaises(FileNotFoundError, task.run_task, {})
+
+
 if __name__ == "__main__":
     unittest.main()
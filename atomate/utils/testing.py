@@ -28,6 +28,22 @@ VASP_CMD = (
 
 
 class AtomateTest(unittest.TestCase):
+    # LaunchPad shared by all tests so that the MongoDB connection is only set up once;
+    # the database itself is still reset for every test
+    _launchpad = None
+
+    @staticmethod
+    def get_launchpad():
+        """
+        Returns the test LaunchPad, creating it on first use. The cache lives on
+        AtomateTest itself, so it is shared by all subclasses.
+        """
+        if AtomateTest._launchpad is None:
+            AtomateTest._launchpad = LaunchPad.from_file(
+                os.path.join(DB_DIR, "my_launchpad.yaml")
+            )
+        return AtomateTest._launchpad
+
     def setUp(self, lpad=True):
         """
         Create scratch directory(removes the old one if there is one) and change to it.
@@ -49,7 +65,7 @@ class AtomateTest(unittest.TestCase):
         os.chdir(self.scratch_dir)
         if lpad:
             try:
-                self.lp = LaunchPad.from_file(os.path.join(DB_DIR, "my_launchpad.yaml"))
+                self.lp = self.get_launchpad()
                 self.lp.reset("", require_password=False)
             except:
                 raise unittest.SkipTest(
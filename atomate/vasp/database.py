@@ -44,6 +44,51 @@ OBJ_NAMES = (
 )
 
 
+def _iterencode_json(d):
+    """
+    Yield the JSON encoding of d in pieces. The output is identical to
+    json.dumps(d, cls=MontyEncoder), but the values of a top-level dict are
+    encoded one at a time so that only the largest of them has to be held in
+    memory as a string.
+
+    Args:
+        d: the object to encode
+
+    Yields:
+        str: consecutive pieces of the JSON document
+    """
+    if not isinstance(d, dict) or not all(isinstance(k, str) for k in d):
+        yield json.dumps(d, cls=MontyEncoder)
+        return
+
+    yield "{"
+    for i, (k, v) in enumerate(d.items()):
+        yield "{}{}: {}".format(
+            ", " if i else "", json.dumps(k), json.dumps(v, cls=MontyEncoder)
+        )
+    yield "}"
+
+
+def _read_zlib_gridfs(grid_out, chunk_size=1 << 20):
+    """
+    Read and decompress a zlib-compressed GridFS file chunk by chunk, so the
+    compressed data is never held in memory next to the decompressed data.
+
+    Args:
+        grid_out (GridOut): the GridFS file to read
+        chunk_size (int): number of compressed bytes to read at a time
+
+    Returns:
+        bytearray: the decompressed data
+    """
+    decompressor = zlib.decompressobj()
+    data = bytearray()
+    for chunk in iter(lambda: grid_out.read(chunk_size), b""):
+        data.extend(decompressor.decompress(chunk))
+    data.extend(decompressor.flush())
+    return data
+
+
 class VaspCalcDb(CalcDb):
     """
     Class to help manage database insertions of Vasp drones
@@ -233,13 +278,7 @@ class VaspCalcDb(CalcDb):
             file id, the type of compression used.
         """
         oid = oid or ObjectId()
-        compression_type = None
-
-        # always perform the string conversion when inserting directly to gridfs
-        d = json.dumps(d, cls=MontyEncoder)
-        if compress:
-            d = zlib.compress(d.encode(), compress)
-            compression_type = "zlib"
+        compression_type = "zlib" if compress else None
 
         fs = gridfs.GridFS(self.db, collection)
         m_data = {"compression": compression_type}
@@ -247,9 +286,24 @@ class VaspCalcDb(CalcDb):
             m_data["task_id"] = task_id
         # Putting task id in the metadata subdocument as per mongo specs:
         # https://github.com/mongodb/specifications/blob/master/source/gridfs/gridfs-spec.rst#terms
-        fs_id = fs.put(d, _id=oid, metadata=m_data)
-
-        return fs_id, compression_type
+        grid_in = fs.new_file(_id=oid, metadata=m_data)
+
+        # always perform the string conversion when inserting directly to gridfs;
+        # the document is encoded and compressed piece by piece so that neither
+        # the full JSON string nor the full compressed blob is held in memory
+        compressor = zlib.compressobj(compress) if compress else None
+        try:
+            for chunk in _iterencode_json(d):
+                chunk = chunk.encode()
+                grid_in.write(compressor.compress(chunk) if compressor else chunk)
+            if compressor:
+                grid_in.write(compressor.flush())
+        except Exception:
+            grid_in.abort()
+            raise
+        grid_in.close()
+
+        return grid_in._id, compression_type
 
     def insert_maggma_store(
         self, d: Any, collection: str, oid: ObjectId = None, task_id: Any = None
@@ -324,8 +378,7 @@ class VaspCalcDb(CalcDb):
             return obj_dict
         else:
             fs = gridfs.GridFS(self.db, f"{key}_fs")
-            bs_json = zlib.decompress(fs.get(fs_id).read())
-            obj_dict = json.loads(bs_json.decode())
+            obj_dict = json.loads(_read_zlib_gridfs(fs.get(fs_id)))
         return obj_dict
 
     def get_band_structure(self, task_id):
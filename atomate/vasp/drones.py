@@ -13,7 +13,6 @@ import datetime
 from fnmatch import fnmatch
 from collections import OrderedDict
 import json
-import glob
 import traceback
 import warnings
 
@@ -392,14 +391,12 @@ class VaspDrone(AbstractDrone):
                     )
                     raise
 
-            # Store symmetry information
-            sg = SpacegroupAnalyzer(
-                Structure.from_dict(d_calc_final["output"]["structure"]), 0.1
-            )
+            # Store symmetry information; SpacegroupAnalyzer runs spglib once and
+            # the getters below all read from that cached dataset
+            final_structure = Structure.from_dict(d_calc_final["output"]["structure"])
+            sg = SpacegroupAnalyzer(final_structure, 0.1)
             if not sg.get_symmetry_dataset():
-                sg = SpacegroupAnalyzer(
-                    Structure.from_dict(d_calc_final["output"]["structure"]), 1e-3, 1
-                )
+                sg = SpacegroupAnalyzer(final_structure, 1e-3, 1)
             d["output"]["spacegroup"] = {
                 "source": "spglib",
                 "symbol": sg.get_space_group_symbol(),
@@ -738,11 +735,18 @@ class VaspDrone(AbstractDrone):
         """
         logger.info("Post-processing dir:{}".format(dir_name))
         fullpath = os.path.abspath(dir_name)
+        # list the directory once and match all the file patterns below against
+        # that listing; like glob, hidden files are skipped
+        dir_files = [f for f in os.listdir(fullpath) if not f.startswith(".")]
+
+        def find_files(pattern):
+            return [os.path.join(fullpath, f) for f in dir_files if fnmatch(f, pattern)]
+
         # VASP input generated by pymatgen's alchemy has a transformations.json file that tracks
         # the origin of a particular structure. If such a file is found, it is inserted into the
         # task doc as d["transformations"]
         transformations = {}
-        filenames = glob.glob(os.path.join(fullpath, "transformations.json*"))
+        filenames = find_files("transformations.json*")
         if len(filenames) >= 1:
             with zopen(filenames[0], "rt") as f:
                 transformations = json.load(f)
@@ -774,7 +778,7 @@ class VaspDrone(AbstractDrone):
         # This is useful for tracking what has actually be done to get a
         # result. If such a file is found, it is inserted into the task doc
         # as d["custodian"]
-        filenames = glob.glob(os.path.join(fullpath, "custodian.json*"))
+        filenames = find_files("custodian.json*")
         if len(filenames) >= 1:
             custodian = []
             for fname in filenames:
@@ -790,7 +794,7 @@ class VaspDrone(AbstractDrone):
         # Calculations using custodian generate a *.orig file for the inputs
         # This is useful to know how the calculation originally started
         # if such files are found they are inserted into orig_inputs
-        filenames = glob.glob(os.path.join(fullpath, "*.orig*"))
+        filenames = find_files("*.orig*")
 
         if len(filenames) >= 1:
             d["orig_inputs"] = {}
@@ -804,7 +808,7 @@ class VaspDrone(AbstractDrone):
                 if "POSCAR.orig" in f:
                     d["orig_inputs"]["poscar"] = Poscar.from_file(f).as_dict()
 
-        filenames = glob.glob(os.path.join(fullpath, "*.json*"))
+        filenames = find_files("*.json*")
         if self.store_additional_json and filenames:
             for filename in filenames:
                 key = os.path.basename(filename).split(".")[0]
@@ -846,7 +850,7 @@ class VaspDrone(AbstractDrone):
             return [parent]
         if (
             not any([parent.endswith(os.sep + r) for r in self.runs])
-            and len(glob.glob(os.path.join(parent, "vasprun.xml*"))) > 0
+            and any(fnmatch(f, "vasprun.xml*") for f in files)
         ):
             return [parent]
         return []
@@ -29,6 +29,10 @@ from atomate.common.firetasks.glue_tasks import get_calc_loc, PassResult, \
 
 logger = get_logger(__name__)
 
+RELAX_EXT_RE = re.compile(r"\.relax\d*")
+# checked in order; ".GZ" takes precedence over ".gz" as it always has
+GZ_EXTS = ("", ".GZ", ".gz")
+
 __author__ = 'Anubhav Jain, Kiran Mathew'
 __email__ = 'ajain@lbl.gov, kmathew@lbl.gov'
 
@@ -99,8 +103,9 @@ class CopyVaspOutputs(CopyFiles):
         self.copy_files()
 
     def copy_files(self):
-        all_files = self.fileclient.listdir(self.from_dir)
-        # start file copy
+        all_files = set(self.fileclient.listdir(self.from_dir))
+        # resolve the source of every file first, then do the copying
+        copies = []
         for f in self.files_to_copy:
             prev_path_full = os.path.join(self.from_dir, f)
             dest_fname = 'POSCAR' if f == 'CONTCAR' and self.get(
@@ -109,22 +114,19 @@ class CopyVaspOutputs(CopyFiles):
 
             relax_ext = ""
             relax_paths = sorted(
-                self.fileclient.glob(prev_path_full + ".relax*"))
+                fname for fname in all_files if fname.startswith(f + ".relax"))
             if relax_paths:
                 if len(relax_paths) > 9:
                     raise ValueError(
                         "CopyVaspOutputs doesn't properly handle >9 relaxations!")
-                m = re.search('\.relax\d*', relax_paths[-1])
+                m = RELAX_EXT_RE.search(relax_paths[-1])
                 relax_ext = m.group(0)
 
-            # detect .gz extension if needed - note that monty zpath() did not seem useful here
-            gz_ext = ""
-            if not (f + relax_ext) in all_files:
-                for possible_ext in [".gz", ".GZ"]:
-                    if (f + relax_ext + possible_ext) in all_files:
-                        gz_ext = possible_ext
+            # find the file as is or with a .gz/.GZ extension - note that monty zpath() did not
+            # seem useful here
+            gz_ext = next((ext for ext in GZ_EXTS if f + relax_ext + ext in all_files), None)
 
-            if not (f + relax_ext + gz_ext) in all_files:
+            if gz_ext is None:
                 # do not fail if KPOINTS is missing, because this might indicate use of automatic
                 # KPOINTS (e.g., KSPACING argument)
                 if f == 'KPOINTS':
@@ -133,16 +135,20 @@ class CopyVaspOutputs(CopyFiles):
                 else:
                     raise ValueError("Cannot find file: {}".format(f))
 
-            # copy the file (minus the relaxation extension)
-            self.fileclient.copy(prev_path_full + relax_ext + gz_ext,
-                                 dest_path + gz_ext)
+            copies.append((prev_path_full + relax_ext + gz_ext, dest_path, gz_ext))
+
+        self.run_copies(self._copy_and_unzip, copies)
+
+    def _copy_and_unzip(self, src, dest_path, gz_ext):
+        # copy the file (minus the relaxation extension)
+        self.fileclient.copy(src, dest_path + gz_ext)
 
-            # unzip the .gz if needed
-            if gz_ext in ['.gz', ".GZ"]:
-                # unzip dest file
-                with open(dest_path, 'wb') as f_out, gzip.open(dest_path + gz_ext, 'rb') as f_in:
-                    shutil.copyfileobj(f_in, f_out)
-                os.remove(dest_path + gz_ext)
+        # unzip the .gz if needed
+        if gz_ext in ['.gz', ".GZ"]:
+            # unzip dest file
+            with open(dest_path, 'wb') as f_out, gzip.open(dest_path + gz_ext, 'rb') as f_in:
+                shutil.copyfileobj(f_in, f_out)
+            os.remove(dest_path + gz_ext)
 
 
 @explicit_serialize
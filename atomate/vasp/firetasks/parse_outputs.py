@@ -238,11 +238,11 @@ class BoltztrapToDb(FiretaskBase):
         v, o = get_vasprun_outcar(bandstructure_dir, parse_eigen=False, parse_dos=False)
         structure = v.final_structure
         d["structure"] = structure.as_dict()
-        d["formula_pretty"] = structure.composition.reduced_formula
+        # also sets "formula_pretty"
         d.update(get_meta_from_structure(structure))
 
         # add the spacegroup
-        sg = SpacegroupAnalyzer(Structure.from_dict(d["structure"]), 0.1)
+        sg = SpacegroupAnalyzer(structure, 0.1)
         d["spacegroup"] = {"symbol": sg.get_space_group_symbol(),
                            "number": sg.get_space_group_number(),
                            "point_group": sg.get_point_group_symbol(),
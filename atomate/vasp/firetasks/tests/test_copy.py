@@ -1,6 +1,7 @@
 # coding: utf-8
 
 
+import gzip
 import os
 import unittest
 
@@ -74,6 +75,19 @@ class TestCopyVaspOutputs(AtomateTest):
             with open(os.path.join(self.scratch_dir, "POSCAR")) as f2:
                 self.assertEqual(f1.read(), f2.read())
 
+    def test_contcar_in_additional_files(self):
+        # POSCAR and CONTCAR both map to POSCAR; CONTCAR comes later and must win
+        for outdir, opener in [(self.plain_outdir, open), (self.gzip_outdir, gzip.open)]:
+            ct = CopyVaspOutputs(calc_dir=outdir, contcar_to_poscar=True,
+                                 additional_files=["CONTCAR"])
+            ct.run_task({})
+            ext = ".gz" if opener is gzip.open else ""
+            with opener(os.path.join(outdir, "CONTCAR" + ext), "rt") as f1:
+                with open(os.path.join(self.scratch_dir, "POSCAR")) as f2:
+                    self.assertEqual(f1.read(), f2.read())
+            self.assertFalse(os.path.exists(os.path.join(self.scratch_dir, "CONTCAR")))
+            self.assertFalse(os.path.exists(os.path.join(self.scratch_dir, "POSCAR.gz")))
+
     def test_gzip_copy(self):
         ct = CopyVaspOutputs(calc_dir=self.gzip_outdir)
         ct.run_task({})
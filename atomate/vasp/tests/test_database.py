@@ -0,0 +1,63 @@
+# coding: utf-8
+
+import datetime
+import io
+import json
+import unittest
+import zlib
+
+import numpy as np
+from monty.json import MontyEncoder
+from pymatgen.core.lattice import Lattice
+
+from atomate.vasp.database import _iterencode_json, _read_zlib_gridfs
+
+
+class IterencodeJsonTest(unittest.TestCase):
+    def setUp(self):
+        self.docs = [
+            {},
+            {
+                "array": np.arange(6).reshape(2, 3),
+                "float": np.float64(1.5),
+                "created_at": datetime.datetime(2021, 3, 3, 12, 30),
+                "lattice": Lattice.cubic(3.0),
+                "nested": {"energies": [1.0, 2.5], "label": "Γ"},
+            },
+            {1: "a", 2.5: "b", None: "c", False: "d"},
+            json.dumps({"dos": [1, 2, 3]}, cls=MontyEncoder),
+            [1, {"a": np.zeros(2)}],
+        ]
+
+    def test_matches_json_dumps(self):
+        for d in self.docs:
+            self.assertEqual(
+                "".join(_iterencode_json(d)), json.dumps(d, cls=MontyEncoder)
+            )
+
+    def test_streamed_compression(self):
+        for d in self.docs:
+            for compress in [True, 6]:
+                compressor = zlib.compressobj(compress)
+                streamed = b"".join(
+                    compressor.compress(chunk.encode())
+                    for chunk in _iterencode_json(d)
+                )
+                streamed += compressor.flush()
+                expected = zlib.compress(
+                    json.dumps(d, cls=MontyEncoder).encode(), compress
+                )
+                self.assertEqual(zlib.decompress(streamed), zlib.decompress(expected))
+
+
+class ReadZlibGridfsTest(unittest.TestCase):
+    def test_round_trip(self):
+        obj = {"energies": list(range(1000)), "label": "band structure"}
+        grid_out = io.BytesIO(zlib.compress(json.dumps(obj).encode()))
+        # a small chunk size exercises decompression across chunk boundaries
+        data = _read_zlib_gridfs(grid_out, chunk_size=64)
+        self.assertEqual(json.loads(data), obj)
+
+
+if __name__ == "__main__":
+    unittest.main()
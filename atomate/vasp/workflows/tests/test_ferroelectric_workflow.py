@@ -18,6 +18,7 @@ __email__ = "blondegeek@gmail.com"
 module_dir = Path(__file__).resolve().parent
 db_dir = module_dir / "../../../common/test_files"
 ref_dir = module_dir / "../../test_files"
+db_file = str((db_dir / "db.json").resolve())
 
 
 class TestFerroelectricWorkflow(AtomateTest):
@@ -95,7 +96,7 @@ class TestFerroelectricWorkflow(AtomateTest):
         self.assertTrue(all(interpolated_polarization_vis))
 
         fw_ids = self.lp.add_wf(self.wf)
-        rapidfire(self.lp, fworker=FWorker(env={"db_file": db_dir / "db.json"}))
+        rapidfire(self.lp, fworker=FWorker(env={"db_file": db_file}))
 
         # Check polar relaxation
         d = self.get_task_collection().find_one(
@@ -121,8 +122,7 @@ class TestFerroelectricWorkflow(AtomateTest):
 
         # check workflow finished without error
         wf = self.lp.get_wf_by_fw_id(fw_id)
-        is_completed = [s == "COMPLETED" for s in wf.fw_states.values()]
-        self.assertTrue(all(is_completed))
+        self.assertTrue(all(s == "COMPLETED" for s in wf.fw_states.values()))
 
 
 def get_simulated_wf(wf):
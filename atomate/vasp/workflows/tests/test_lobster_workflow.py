@@ -91,7 +91,7 @@ class TestWFLobster(AtomateTest):
         self._check_run(d, mode="lobsternormal", database=False)
 
         wf = self.lp.get_wf_by_fw_id(1)
-        self.assertTrue(all([s == 'COMPLETED' for s in wf.fw_states.values()]))
+        self.assertTrue(all(s == 'COMPLETED' for s in wf.fw_states.values()))
 
     def _single_lobster_db_insertion(self, delete_wavecars=False,
                                      user_supplied_basis=None, fake=True):
@@ -118,7 +118,7 @@ class TestWFLobster(AtomateTest):
             self._check_run(d, mode="lobsternormal")
 
         wf = self.lp.get_wf_by_fw_id(1)
-        self.assertTrue(all([s == 'COMPLETED' for s in wf.fw_states.values()]))
+        self.assertTrue(all(s == 'COMPLETED' for s in wf.fw_states.values()))
 
     def test_single_vasp_lobster(self):
         self._single_vasp_lobster(fake=True)
@@ -185,7 +185,7 @@ class TestWFLobsterTestBasis(AtomateTest):
         self._check_run(d, mode="lobsternormal")
 
         wf = self.lp.get_wf_by_fw_id(1)
-        self.assertTrue(all([s == 'COMPLETED' for s in wf.fw_states.values()]))
+        self.assertTrue(all(s == 'COMPLETED' for s in wf.fw_states.values()))
 
     def _single_lobster_db_insertion(self, fake=True):
         structure = self.struct_mp
@@ -207,7 +207,7 @@ class TestWFLobsterTestBasis(AtomateTest):
         self._check_run(d, mode="lobsternormal")
 
         wf = self.lp.get_wf_by_fw_id(1)
-        self.assertTrue(all([s == 'COMPLETED' for s in wf.fw_states.values()]))
+        self.assertTrue(all(s == 'COMPLETED' for s in wf.fw_states.values()))
 
     def test_single_vasp_lobster(self):
         # will only test lobster_calculation_1